@@ -4,27 +4,306 @@ LinkPulse CLI - YouTube and Blog Post Affiliate Link Checker
 """
 
 import argparse
-import asyncio
+import hashlib
+import html
 import json
+import os
+import queue
 import random
 import re
 import sys
+import threading
 import time
+from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import requests
 import yaml
+import soupsieve
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 try:
-    from googleapiclient.discovery import build
-    YOUTUBE_API_AVAILABLE = True
+    from yaml import CSafeLoader as SafeLoader  # LibYAML bindings
 except ImportError:
-    YOUTUBE_API_AVAILABLE = False
+    from yaml import SafeLoader
+
+# The Google API client and requests-cache are slow to import and often go
+# unused (no API key, --no-cache), so only check they're installed here and
+# import them where they're used
+YOUTUBE_API_AVAILABLE = find_spec('googleapiclient') is not None
+REQUESTS_CACHE_AVAILABLE = find_spec('requests_cache') is not None
+
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+try:
+    from pybloom_live import ScalableBloomFilter
+    BLOOM_FILTER_AVAILABLE = True
+except ImportError:
+    BLOOM_FILTER_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+
+# YouTube URL formats, each unioned into a single pattern
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})'
+)
+_CHANNEL_ID_RE = re.compile(
+    r'youtube\.com/(?:(?:channel|c|user)/([a-zA-Z0-9_-]+)|@([a-zA-Z0-9_.-]+))'
+)
+
+# Amazon OneLink forms: short links and tagged US/UK product links
+_ONELINK_RE = re.compile(
+    r'amzn\.to/'
+    r'|amazon\.com/.*tag=.*-20'  # US affiliate links with tag
+    r'|amazon\.co\.uk/.*tag=.*-21'  # UK affiliate links with tag
+    r'|amazon\.com/dp/.*\?.*tag='  # Direct product links with tags
+    r'|amazon\.co\.uk/dp/.*\?.*tag=',
+    re.IGNORECASE
+)
+# Affiliate link patterns, unioned into a single regex so each text is
+# scanned once. Group number maps back to the platform. Patterns are
+# lowercase and run against a lowercased copy of the text.
+_AFFILIATE_PATTERNS = (
+    # Amazon patterns (UK and US)
+    (r'https?://(?:www\.)?amazon\.co\.uk/[^\s]+', 'amazon'),
+    (r'https?://(?:www\.)?amazon\.com/[^\s]+', 'amazon'),
+    (r'https?://amzn\.to/[a-zA-Z0-9]+', 'amazon'),
+    # AliExpress patterns
+    (r'https?://(?:www\.)?aliexpress\.com/[^\s]+', 'aliexpress'),
+    (r'https?://s\.click\.aliexpress\.com/e/_[a-zA-Z0-9]+', 'aliexpress'),
+)
+_AFFILIATE_RE = re.compile('|'.join(f'({pattern})' for pattern, _ in _AFFILIATE_PATTERNS))
+_AFFILIATE_RE_CI = re.compile(_AFFILIATE_RE.pattern, re.IGNORECASE)
+_AFFILIATE_PLATFORMS = tuple(platform for _, platform in _AFFILIATE_PATTERNS)
+# Literal host fragments that every affiliate pattern contains; a text
+# without any of them cannot match, so the regex scan can be skipped
+_AFFILIATE_HOSTS = ('amazon.', 'amzn.to/', 'aliexpress.com/')
+# Any URL, stripped from a line to leave its descriptive text
+_ANY_URL_RE = re.compile(r'https?://[^\s]+')
+
+# Amazon product ID (ASIN) locations, tried in order
+_AMAZON_PRODUCT_ID_RES = (
+    re.compile(r'/dp/([A-Z0-9]{10})', re.IGNORECASE),
+    re.compile(r'/gp/product/([A-Z0-9]{10})', re.IGNORECASE),
+)
+
+# Compressed encodings urllib3 can actually decode here: gzip and deflate,
+# plus br/zstd only when brotli/zstandard are installed. Advertising br
+# without a decoder gets Amazon and others to send bodies nothing can read.
+_ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+
+
+@lru_cache(maxsize=4096)
+def _extract_video_id(url: str) -> Optional[str]:
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+@lru_cache(maxsize=4096)
+def _extract_channel_id(channel_url: str) -> Optional[str]:
+    match = _CHANNEL_ID_RE.search(channel_url)
+    return match.group(match.lastindex) if match else None
+
+
+# Query parameters that only track the click - they never change which
+# product a link resolves to
+_TRACKING_PARAMS = frozenset(['ref', 'ref_', 'linkcode', 'linkid'])
+_TRACKING_PARAM_PREFIXES = ('utm_', 'aff_')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_link_url(url: str) -> str:
+    """Drop tracking parameters and the fragment so duplicate links share a cache key"""
+    parts = urlsplit(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+
+@lru_cache(maxsize=4096)
+def _url_host(url: str) -> str:
+    """Lowercased host of url, parsed once per distinct URL"""
+    return urlsplit(url).netloc.lower()
+
+
+def create_session(settings: dict, headers: Optional[dict] = None,
+                   cache_ttl: Optional[int] = None) -> requests.Session:
+    """Create a requests session with a pooled, retrying HTTP adapter
+    
+    With cache_ttl set, caching enabled and requests-cache installed,
+    responses are kept for cache_ttl seconds in an SQLite store under
+    cache_dir. Once an entry expires it is revalidated with its
+    ETag/Last-Modified, so an unchanged page comes back as a body-less 304.
+    
+    A cached session reads every cacheable body in full, even with
+    stream=True, so fetches that stop reading early need a plain session.
+    """
+    session = None
+    if cache_ttl is not None and settings['cache_enabled'] and REQUESTS_CACHE_AVAILABLE:
+        try:
+            from requests_cache import CachedSession
+            session = CachedSession(
+                os.path.join(settings['cache_dir'], 'http'),
+                backend='sqlite',
+                expire_after=cache_ttl,
+                # cache_ttl is an upper bound - a long max-age from the
+                # server must not outlive it
+                cache_control=False,
+            )
+        except Exception as e:
+            print(f"⚠️  Could not open HTTP cache in '{settings['cache_dir']}': {e}")
+    if session is None:
+        session = requests.Session()
+    
+    # Keep at least one idle connection per worker thread for each host,
+    # otherwise connections beyond the pool size are dropped after use and
+    # the next request pays for a new TCP/TLS handshake
+    pool_size = max(32, settings['concurrent_requests'])
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=settings['retry_attempts'],
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,  # hand the final response to the caller
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    if headers:
+        session.headers.update(headers)
+    
+    return session
+
+
+# <meta charset="..."> or the http-equiv Content-Type form, both of which
+# sit at the top of <head>
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+def _declared_charset(response) -> Optional[str]:
+    """Charset from the Content-Type header, or None if it doesn't name one
+    
+    requests reports ISO-8859-1 for any text/* response without a charset,
+    which garbles UTF-8 pages; None lets HtmlPage go by the page's own
+    <meta charset> instead.
+    """
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
+
+
+@lru_cache(maxsize=64)
+def _compile_selector(selector: str):
+    """Compile a CSS selector once for the BeautifulSoup fallback"""
+    return soupsieve.compile(selector)
+
+
+class HtmlPage:
+    """Parsed HTML page exposing just the lookups the link checker needs
+    
+    Uses selectolax's lexbor parser (C, CSS selectors run natively) when it
+    is installed, otherwise BeautifulSoup with lxml.
+    """
+    
+    def __init__(self, page: bytes, encoding: Optional[str] = None):
+        self._tree = None
+        self._soup = None
+        self._meta = None
+        if SELECTOLAX_AVAILABLE:
+            if encoding is None:
+                match = _META_CHARSET_RE.search(page, 0, 4096)
+                encoding = match.group(1).decode('ascii') if match else 'utf-8'
+            try:
+                text = page.decode(encoding, 'replace')
+            except LookupError:
+                text = page.decode('utf-8', 'replace')
+            self._tree = LexborHTMLParser(text)
+        else:
+            self._soup = BeautifulSoup(page, 'lxml', from_encoding=encoding)
+    
+    def texts(self, selector: str):
+        """Yield the text of each element matching selector, in document order"""
+        if self._tree is not None:
+            for node in self._tree.css(selector):
+                yield node.text()
+        else:
+            for elem in _compile_selector(selector).select(self._soup):
+                yield elem.get_text()
+    
+    def first_text(self, selector: str) -> Optional[str]:
+        """Text of the first element matching selector"""
+        return next(self.texts(selector), None)
+    
+    def attr(self, selector: str, name: str) -> Optional[str]:
+        """Attribute of the first element matching selector"""
+        if self._tree is not None:
+            node = self._tree.css_first(selector)
+            return node.attributes.get(name) if node is not None else None
+        elem = _compile_selector(selector).select_one(self._soup)
+        return elem.get(name) if elem is not None else None
+    
+    def meta(self) -> Dict[Tuple[str, str], str]:
+        """Content of every <meta>, keyed on (attribute, value) of its
+        property, name or itemprop - collected in one pass, first tag wins
+        """
+        if self._meta is None:
+            if self._tree is not None:
+                tags = (node.attributes for node in self._tree.css('meta[content]'))
+            else:
+                tags = (elem.attrs for elem in self._soup.find_all('meta', content=True))
+            self._meta = {}
+            for attrs in tags:
+                for kind in ('property', 'name', 'itemprop'):
+                    value = attrs.get(kind)
+                    if value:
+                        self._meta.setdefault((kind, value), attrs.get('content'))
+        return self._meta
+    
+    def text(self) -> str:
+        """All visible page text, excluding scripts and styles"""
+        if self._tree is not None:
+            self._tree.strip_tags(['script', 'style'])
+            return self._tree.root.text()
+        return self._soup.get_text()
+    
+    def links(self):
+        """Yield (anchor text, href) for each <a> with an href, in document order"""
+        if self._tree is not None:
+            for node in self._tree.css('a[href]'):
+                yield node.text(), node.attributes.get('href') or ''
+        else:
+            for link in self._soup.find_all('a', href=True):
+                yield link.get_text(), link['href']
 
 
 class Config:
@@ -38,7 +317,7 @@ class Config:
         """Load and validate configuration from YAML file"""
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
             
             # Validate required sections
             if 'sources' not in config:
@@ -58,6 +337,14 @@ class Config:
                 'days_back': settings.get('days_back', 180),
                 'check_regions': settings.get('check_regions', ['US', 'UK']),
                 'enable_onelink_checking': settings.get('enable_onelink_checking', True),
+                'cache_enabled': settings.get('cache_enabled', True),
+                'cache_dir': settings.get('cache_dir', '.linkpulse-cache'),
+                'discovery_cache_ttl': settings.get('discovery_cache_ttl', 3600),
+                'youtube_cache_ttl': settings.get('youtube_cache_ttl', 86400),
+                'link_cache_ttl': settings.get('link_cache_ttl', 86400),
+                'http_cache_ttl': settings.get('http_cache_ttl', 21600),
+                'max_page_bytes': settings.get('max_page_bytes', 1048576),
+                'max_requests_per_host': settings.get('max_requests_per_host', 3),
             }
             
             return config
@@ -73,43 +360,75 @@ class Config:
         except ValueError as e:
             print(f"❌ Error: {e}")
             sys.exit(1)
+    
+    def open_cache(self) -> Optional['Cache']:
+        """Open the on-disk cache, or return None if caching is disabled or unavailable"""
+        settings = self.data['settings']
+        if not settings['cache_enabled'] or not DISKCACHE_AVAILABLE:
+            return None
+        
+        try:
+            return Cache(settings['cache_dir'])
+        except Exception as e:
+            print(f"⚠️  Could not open cache at '{settings['cache_dir']}': {e}")
+            return None
 
 
 class ChannelScraper:
     """YouTube channel scraping functionality"""
     
-    def __init__(self, config: Config, verbose: bool = False):
+    def __init__(self, config: Config, verbose: bool = False, cache: Optional['Cache'] = None):
         self.config = config
         self.verbose = verbose
-        self.session = requests.Session()
+        self.cache = cache
+        
+        # Bind the settings used in hot paths once instead of re-reading the
+        # nested config dict on every call
+        settings = config.data['settings']
+        self.max_videos = settings['max_videos_per_channel']
+        self.cache_ttl = settings['discovery_cache_ttl']
+        
+        self.session = create_session(settings, headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': _ACCEPT_ENCODING,
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+        })
         
         # Initialize YouTube API if available
         self.youtube_service = None
         if (YOUTUBE_API_AVAILABLE and 
-            self.config.data['settings'].get('youtube_api_key')):
+            settings.get('youtube_api_key')):
             try:
+                from googleapiclient.discovery import build
                 self.youtube_service = build(
                     'youtube', 'v3',
-                    developerKey=self.config.data['settings']['youtube_api_key']
+                    developerKey=settings['youtube_api_key']
                 )
             except Exception as e:
                 if self.verbose:
                     print(f"⚠️  YouTube API initialization failed: {e}")
+        
+        # Patterns for video IDs in channel page JavaScript/JSON, unioned so
+        # each page is scanned once. Compiled as bytes so the raw body can be
+        # scanned without decoding it.
+        video_patterns = [
+            r'"videoId":"([a-zA-Z0-9_-]{11})"',
+            r'/watch\?v=([a-zA-Z0-9_-]{11})',
+            r'"url":"/watch\?v=([a-zA-Z0-9_-]{11})"',
+            r'videoRenderer":\{[^}]*"videoId":"([a-zA-Z0-9_-]{11})"',
+            r'"watchEndpoint":\{"videoId":"([a-zA-Z0-9_-]{11})"',
+        ]
+        self._video_id_re = re.compile('|'.join(video_patterns).encode())
     
     def extract_channel_id(self, channel_url: str) -> Optional[str]:
         """Extract channel ID from various YouTube channel URL formats"""
-        patterns = [
-            r'youtube\.com/channel/([a-zA-Z0-9_-]+)',
-            r'youtube\.com/c/([a-zA-Z0-9_-]+)',  
-            r'youtube\.com/user/([a-zA-Z0-9_-]+)',
-            r'youtube\.com/@([a-zA-Z0-9_.-]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, channel_url)
-            if match:
-                return match.group(1)
-        return None
+        return _extract_channel_id(channel_url)
     
     def get_channel_videos_api(self, channel_url: str) -> List[Dict]:
         """Get channel videos using YouTube API"""
@@ -121,7 +440,7 @@ class ChannelScraper:
             return []
         
         videos = []
-        max_videos = self.config.data['settings']['max_videos_per_channel']
+        max_videos = self.max_videos
         
         try:
             # First get channel info to handle different URL formats
@@ -189,7 +508,7 @@ class ChannelScraper:
     def get_channel_videos_scraping(self, channel_url: str) -> List[Dict]:
         """Get channel videos using web scraping as fallback"""
         videos = []
-        max_videos = self.config.data['settings']['max_videos_per_channel']
+        max_videos = self.max_videos
         
         try:
             # Try multiple URL formats for better compatibility
@@ -199,18 +518,6 @@ class ChannelScraper:
                 channel_url.rstrip('/'),
             ]
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-            }
-            
             found_video_ids = set()
             
             for url in urls_to_try:
@@ -221,36 +528,28 @@ class ChannelScraper:
                     if self.verbose:
                         print(f"  Trying URL: {url}")
                     
-                    response = self.session.get(url, headers=headers, timeout=30)
-                    response.raise_for_status()
-                    
-                    # Multiple approaches to extract video IDs
-                    
-                    # 1. Look for video IDs in JavaScript/JSON
-                    video_patterns = [
-                        r'"videoId":"([a-zA-Z0-9_-]{11})"',
-                        r'/watch\?v=([a-zA-Z0-9_-]{11})',
-                        r'"url":"/watch\?v=([a-zA-Z0-9_-]{11})"',
-                        r'videoRenderer":\{[^}]*"videoId":"([a-zA-Z0-9_-]{11})"',
-                        r'"watchEndpoint":\{"videoId":"([a-zA-Z0-9_-]{11})"',
-                    ]
-                    
-                    for pattern in video_patterns:
-                        matches = re.findall(pattern, response.text)
-                        found_video_ids.update(matches)
-                        if len(found_video_ids) >= max_videos:
-                            break
-                    
-                    # 2. Also look in HTML for any remaining video links
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        if '/watch?v=' in href:
-                            match = re.search(r'v=([a-zA-Z0-9_-]{11})', href)
-                            if match:
-                                found_video_ids.add(match.group(1))
+                    # Stream the page so we can stop reading as soon as
+                    # enough video IDs have been seen (channel pages are
+                    # often several MB)
+                    response = self.session.get(url, timeout=30, stream=True)
+                    try:
+                        response.raise_for_status()
+                        
+                        # Look for video IDs in JavaScript/JSON and
+                        # /watch?v= links. Carry a little text over between
+                        # chunks so matches spanning a boundary aren't lost.
+                        tail = b''
+                        for chunk in response.iter_content(chunk_size=65536):
+                            text = tail + chunk
+                            for match in self._video_id_re.finditer(text):
+                                found_video_ids.add(match.group(match.lastindex).decode('ascii'))
                                 if len(found_video_ids) >= max_videos:
                                     break
+                            if len(found_video_ids) >= max_videos:
+                                break
+                            tail = text[-1024:]
+                    finally:
+                        response.close()
                     
                     if found_video_ids:
                         if self.verbose:
@@ -282,6 +581,14 @@ class ChannelScraper:
         if self.verbose:
             print(f"🔍 Discovering videos from channel: {channel_url}")
         
+        cache_key = ('channel_videos', channel_url)
+        if self.cache is not None:
+            videos = self.cache.get(cache_key)
+            if videos is not None:
+                if self.verbose:
+                    print(f"📺 Found {len(videos)} videos from channel (cached)")
+                return videos
+        
         # Try API first
         videos = self.get_channel_videos_api(channel_url)
         
@@ -292,17 +599,45 @@ class ChannelScraper:
         if self.verbose:
             print(f"📺 Found {len(videos)} videos from channel")
         
+        if self.cache is not None and videos:
+            self.cache.set(cache_key, videos, expire=self.cache_ttl)
+        
         return videos
 
 
 class DomainScraper:
     """Website domain scraping functionality"""
     
-    def __init__(self, config: Config, verbose: bool = False):
+    def __init__(self, config: Config, verbose: bool = False, cache: Optional['Cache'] = None):
         self.config = config
         self.verbose = verbose
-        self.session = requests.Session()
-        self.visited_urls = set()
+        self.cache = cache
+        
+        # Bind the settings used in hot paths once instead of re-reading the
+        # nested config dict on every call
+        settings = config.data['settings']
+        self.max_posts = settings['max_posts_per_domain']
+        self.crawl_depth = settings['crawl_depth']
+        self.cache_ttl = settings['discovery_cache_ttl']
+        
+        # Sitemaps are streamed over a plain session. Feeds and crawled pages
+        # go through an HTTP cache that never outlives the discovery results
+        # built from them.
+        self.session = create_session(settings)
+        self.feed_session = create_session(
+            settings, cache_ttl=min(settings['http_cache_ttl'], self.cache_ttl)
+        )
+        # Visited URLs are tracked as 64-bit digests. With pybloom-live
+        # installed they go into a Bloom filter (~2 bytes per URL at a 0.1%
+        # false-positive rate, i.e. the odd page skipped) rather than a set.
+        if BLOOM_FILTER_AVAILABLE:
+            self.visited_urls = ScalableBloomFilter(
+                initial_capacity=self.max_posts * self.crawl_depth * 20,
+                error_rate=0.001
+            )
+        else:
+            self.visited_urls = set()
+        self._visited_lock = threading.Lock()
         
         # Common blog/article URL patterns
         self.article_patterns = [
@@ -323,6 +658,11 @@ class DomainScraper:
             r'/wp-content/',
             r'\.jpg$|\.png$|\.gif$|\.pdf$|\.zip$',
         ]
+        
+        # Patterns are lowercase and matched against a lowercased URL, which
+        # is cheaper than case-folding with re.IGNORECASE on every match
+        self._article_re = re.compile('|'.join(self.article_patterns))
+        self._exclude_re = re.compile('|'.join(self.exclude_patterns))
     
     def normalize_url(self, url: str, base_url: str) -> str:
         """Normalize and make URL absolute"""
@@ -336,25 +676,58 @@ class DomainScraper:
             url = urljoin(base_url, url)
         return url
     
+    def url_key(self, url: str) -> int:
+        """Compact 64-bit digest of a URL for visited-set membership"""
+        return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'little')
+    
     def is_article_url(self, url: str) -> bool:
         """Check if URL looks like an article/blog post"""
-        # Check if it matches article patterns
-        for pattern in self.article_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
+        lowered = url.lower()
         
-        # Check if it should be excluded
-        for pattern in self.exclude_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False
+        # Check if it should be excluded (tag/category listings, assets, ...)
+        if self._exclude_re.search(lowered):
+            return False
+        
+        # Check if it matches article patterns
+        if self._article_re.search(lowered):
+            return True
         
         # Additional heuristics - if URL has more path segments, likely an article
-        path_segments = url.split('/')
-        return len(path_segments) > 4
+        # (https://host/a/b has 4 slashes)
+        return url.count('/') > 3
+    
+    def close(self):
+        """Close the scraper's sessions"""
+        self.session.close()
+        self.feed_session.close()
+    
+    def fetch_candidates(self, session: requests.Session, urls: List[str],
+                         stream: bool = False) -> List:
+        """Fetch candidate URLs concurrently
+        
+        Returns a response (or the exception raised) for each URL, in the
+        same order as urls, so callers can still honour their priority order.
+        Streamed responses must be closed by the caller.
+        """
+        def fetch(url):
+            try:
+                return session.get(url, timeout=10, stream=stream)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return list(executor.map(fetch, urls))
     
     def get_sitemap_urls(self, domain: str) -> List[str]:
         """Extract URLs from sitemap.xml"""
+        cache_key = ('sitemap_urls', domain)
+        if self.cache is not None:
+            cached_urls = self.cache.get(cache_key)
+            if cached_urls is not None:
+                return cached_urls
+        
         urls = []
+        max_posts = self.max_posts
         sitemap_urls = [
             f"{domain}/sitemap.xml",
             f"{domain}/sitemap_index.xml",
@@ -362,39 +735,68 @@ class DomainScraper:
             f"{domain}/blog-sitemap.xml",
         ]
         
-        for sitemap_url in sitemap_urls:
-            try:
-                if self.verbose:
-                    print(f"  Checking sitemap: {sitemap_url}")
-                
-                response = self.session.get(sitemap_url, timeout=10)
-                if response.status_code == 200:
-                    try:
-                        soup = BeautifulSoup(response.text, 'xml')
-                    except:
-                        soup = BeautifulSoup(response.text, 'html.parser')
+        # Probe every candidate at once; worst case is one timeout, not four.
+        # Bodies are streamed, so a sitemap is only read as far as needed.
+        responses = self.fetch_candidates(self.session, sitemap_urls, stream=True)
+        
+        try:
+            for sitemap_url, response in zip(sitemap_urls, responses):
+                try:
+                    if self.verbose:
+                        print(f"  Checking sitemap: {sitemap_url}")
+                    
+                    if isinstance(response, Exception):
+                        raise response
                     
-                    # Look for URLs in sitemap
-                    for loc in soup.find_all('loc'):
-                        url = loc.get_text().strip()
-                        if self.is_article_url(url):
-                            urls.append(url)
+                    if response.status_code == 200:
+                        # Parse <loc> elements straight off the socket instead
+                        # of buffering the whole document - large sitemaps
+                        # can be tens of MB
+                        response.raw.decode_content = True
+                        context = etree.iterparse(response.raw, tag='{*}loc', recover=True)
+                        for _, loc in context:
+                            url = (loc.text or '').strip()
+                            if url and self.is_article_url(url):
+                                urls.append(url)
                             
-                    if self.verbose:
-                        print(f"  Found {len(urls)} URLs in sitemap")
-                        
-                    if urls:  # If we found URLs, don't try other sitemaps
-                        break
+                            # Drop processed entries so memory stays flat
+                            loc.clear()
+                            entry = loc.getparent()
+                            if entry is not None:
+                                while entry.getprevious() is not None:
+                                    del entry.getparent()[0]
+                            
+                            if len(urls) >= max_posts:
+                                break
                         
-            except Exception as e:
-                if self.verbose:
-                    print(f"  Sitemap {sitemap_url} failed: {e}")
-                continue
-        
-        return urls[:self.config.data['settings']['max_posts_per_domain']]
+                        if self.verbose:
+                            print(f"  Found {len(urls)} URLs in sitemap")
+                            
+                        if urls:  # If we found URLs, don't try other sitemaps
+                            break
+                            
+                except Exception as e:
+                    if self.verbose:
+                        print(f"  Sitemap {sitemap_url} failed: {e}")
+                    continue
+        finally:
+            for response in responses:
+                if not isinstance(response, Exception):
+                    response.close()
+        
+        urls = urls[:max_posts]
+        if self.cache is not None and urls:
+            self.cache.set(cache_key, urls, expire=self.cache_ttl)
+        return urls
     
     def get_rss_urls(self, domain: str) -> List[str]:
         """Extract URLs from RSS feeds"""
+        cache_key = ('rss_urls', domain)
+        if self.cache is not None:
+            cached_urls = self.cache.get(cache_key)
+            if cached_urls is not None:
+                return cached_urls
+        
         urls = []
         rss_urls = [
             f"{domain}/feed",
@@ -404,17 +806,22 @@ class DomainScraper:
             f"{domain}/news/feed",
         ]
         
-        for rss_url in rss_urls:
+        # Probe every candidate at once; worst case is one timeout, not five
+        responses = self.fetch_candidates(self.feed_session, rss_urls)
+        
+        for rss_url, response in zip(rss_urls, responses):
             try:
                 if self.verbose:
                     print(f"  Checking RSS feed: {rss_url}")
                 
-                response = self.session.get(rss_url, timeout=10)
+                if isinstance(response, Exception):
+                    raise response
+                
                 if response.status_code == 200:
                     try:
-                        soup = BeautifulSoup(response.text, 'xml')
+                        soup = BeautifulSoup(response.content, 'xml')
                     except:
-                        soup = BeautifulSoup(response.text, 'html.parser')
+                        soup = BeautifulSoup(response.content, 'lxml')
                     
                     # Look for URLs in RSS items
                     for item in soup.find_all('item'):
@@ -443,38 +850,44 @@ class DomainScraper:
                     print(f"  RSS feed {rss_url} failed: {e}")
                 continue
         
-        return urls[:self.config.data['settings']['max_posts_per_domain']]
+        urls = urls[:self.max_posts]
+        if self.cache is not None and urls:
+            self.cache.set(cache_key, urls, expire=self.cache_ttl)
+        return urls
     
     def crawl_domain(self, domain: str, current_depth: int = 0) -> List[str]:
         """Crawl domain for article URLs"""
-        if current_depth >= self.config.data['settings']['crawl_depth']:
+        if current_depth >= self.crawl_depth:
             return []
         
         urls = []
-        max_posts = self.config.data['settings']['max_posts_per_domain']
+        max_posts = self.max_posts
         
         try:
             if self.verbose and current_depth == 0:
                 print(f"  Crawling domain: {domain}")
             
-            response = self.session.get(domain, timeout=15)
+            response = self.feed_session.get(domain, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml_html.fromstring(response.content)
+            new_links = []
             
             # Extract all internal links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
+            for href in tree.xpath('//a/@href'):
                 full_url = self.normalize_url(href, domain)
                 
-                # Skip if already visited or external
-                if full_url in self.visited_urls:
-                    continue
-                    
+                # Skip if external or already visited
                 if not full_url.startswith(domain):
                     continue
                 
-                self.visited_urls.add(full_url)
+                url_key = self.url_key(full_url)
+                with self._visited_lock:
+                    if url_key in self.visited_urls:
+                        continue
+                    self.visited_urls.add(url_key)
+                
+                new_links.append(full_url)
                 
                 # Check if this looks like an article
                 if self.is_article_url(full_url):
@@ -483,8 +896,10 @@ class DomainScraper:
                         break
             
             # If we haven't found enough and depth allows, crawl some promising links
-            if len(urls) < max_posts // 2 and current_depth < self.config.data['settings']['crawl_depth'] - 1:
-                promising_links = [url for url in self.visited_urls if '/blog' in url or '/news' in url][:3]
+            if len(urls) < max_posts // 2 and current_depth < self.crawl_depth - 1:
+                # Only consider links first seen on this page - visited_urls is
+                # shared with crawls of other domains running concurrently
+                promising_links = [url for url in new_links if '/blog' in url or '/news' in url][:3]
                 for link in promising_links:
                     sub_urls = self.crawl_domain(link, current_depth + 1)
                     urls.extend(sub_urls)
@@ -507,31 +922,39 @@ class DomainScraper:
             domain = 'https://' + domain
         
         urls = []
+        seen = set()
         
         # Try sitemap first (most reliable)
         sitemap_urls = self.get_sitemap_urls(domain)
         if sitemap_urls:
             urls.extend(sitemap_urls)
+            seen.update(sitemap_urls)
             if self.verbose:
                 print(f"  Sitemap method: {len(sitemap_urls)} URLs")
         
         # Try RSS feeds if sitemap didn't yield enough
-        if len(urls) < self.config.data['settings']['max_posts_per_domain'] // 2:
+        if len(urls) < self.max_posts // 2:
             rss_urls = self.get_rss_urls(domain)
-            urls.extend([url for url in rss_urls if url not in urls])
+            for url in rss_urls:
+                if url not in seen:
+                    seen.add(url)
+                    urls.append(url)
             if self.verbose and rss_urls:
                 print(f"  RSS method: {len(rss_urls)} URLs")
         
         # Try crawling if other methods didn't yield enough
-        if len(urls) < self.config.data['settings']['max_posts_per_domain'] // 2:
+        if len(urls) < self.max_posts // 2:
             crawl_urls = self.crawl_domain(domain)
-            urls.extend([url for url in crawl_urls if url not in urls])
+            for url in crawl_urls:
+                if url not in seen:
+                    seen.add(url)
+                    urls.append(url)
             if self.verbose and crawl_urls:
                 print(f"  Crawling method: {len(crawl_urls)} URLs")
         
         # Convert URLs to the format expected by the main processor
         posts = []
-        for url in urls[:self.config.data['settings']['max_posts_per_domain']]:
+        for url in urls[:self.max_posts]:
             posts.append({
                 'url': url,
                 'title': None  # Will be fetched when processing
@@ -546,36 +969,56 @@ class DomainScraper:
 class URLDiscovery:
     """Orchestrator for discovering URLs from channels and domains"""
     
-    def __init__(self, config: Config, verbose: bool = False):
+    def __init__(self, config: Config, verbose: bool = False, cache: Optional['Cache'] = None):
         self.config = config
         self.verbose = verbose
-        self.channel_scraper = ChannelScraper(config, verbose)
-        self.domain_scraper = DomainScraper(config, verbose)
+        self.cache = cache if cache is not None else config.open_cache()
+        self.channel_scraper = ChannelScraper(config, verbose, self.cache)
+        self.domain_scraper = DomainScraper(config, verbose, self.cache)
+    
+    def close(self):
+        """Close the scrapers' sessions"""
+        self.channel_scraper.session.close()
+        self.domain_scraper.close()
     
     def discover_all_sources(self) -> Tuple[List[Dict], List[Dict]]:
         """Discover videos from channels and posts from domains"""
         discovered_videos = []
         discovered_posts = []
         
-        # Process YouTube channels
-        channels = self.config.data['sources'].get('youtube_channels', [])
-        for channel in channels:
+        channel_urls = []
+        for channel in self.config.data['sources'].get('youtube_channels', []) or []:
             channel_url = channel.get('url') or channel.get('channel_id')
-            if not channel_url:
-                continue
-                
-            videos = self.channel_scraper.get_channel_videos(channel_url)
-            discovered_videos.extend(videos)
+            if channel_url:
+                channel_urls.append(channel_url)
         
-        # Process website domains  
-        domains = self.config.data['sources'].get('website_domains', [])
-        for domain in domains:
+        domain_urls = []
+        for domain in self.config.data['sources'].get('website_domains', []) or []:
             domain_url = domain.get('url') or domain.get('domain')
-            if not domain_url:
-                continue
-                
-            posts = self.domain_scraper.get_domain_posts(domain_url)
-            discovered_posts.extend(posts)
+            if domain_url:
+                domain_urls.append(domain_url)
+        
+        if not channel_urls and not domain_urls:
+            return discovered_videos, discovered_posts
+        
+        # Discovery is dominated by HTTP latency, so probe all channels and
+        # domains concurrently instead of one after another
+        max_workers = self.config.data['settings']['concurrent_requests']
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            channel_futures = [
+                executor.submit(self.channel_scraper.get_channel_videos, url)
+                for url in channel_urls
+            ]
+            domain_futures = [
+                executor.submit(self.domain_scraper.get_domain_posts, url)
+                for url in domain_urls
+            ]
+            
+            # Collect in config order so output stays deterministic
+            for future in channel_futures:
+                discovered_videos.extend(future.result())
+            for future in domain_futures:
+                discovered_posts.extend(future.result())
         
         return discovered_videos, discovered_posts
 
@@ -586,8 +1029,44 @@ class LinkChecker:
     def __init__(self, config: Config, verbose: bool = False):
         self.config = config
         self.verbose = verbose
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        self.cache = config.open_cache()
+        
+        # Settings read on every request, bound once instead of walking the
+        # nested config dict each time
+        settings = config.data['settings']
+        self.request_timeout = settings['request_timeout']
+        self.delay_between_requests = settings['delay_between_requests']
+        self.concurrent_requests = settings['concurrent_requests']
+        self.max_page_bytes = settings['max_page_bytes']
+        self.max_requests_per_host = settings['max_requests_per_host']
+        self.check_regions = settings['check_regions']
+        self.enable_onelink_checking = settings['enable_onelink_checking']
+        self.link_cache_ttl = settings['link_cache_ttl']
+        self.youtube_cache_ttl = settings['youtube_cache_ttl']
+        
+        # Product pages and video scrapes are streamed and cut off early, and
+        # a bot wall or "unavailable" page arrives as a 200 - neither belongs
+        # in the HTTP cache. Only blog posts are fetched through it.
+        self.session = create_session(settings)
+        self.cached_session = create_session(settings, cache_ttl=settings['http_cache_ttl'])
+        
+        # Check results for this run, keyed on (platform, normalized URL).
+        # The per-key locks make concurrent duplicates wait for the first
+        # check instead of repeating it.
+        self._link_results = {}
+        self._link_locks = {}
+        self._link_locks_lock = threading.Lock()
+        
+        # Per-host caps on in-flight requests, so concurrent_requests can be
+        # raised without every worker landing on the same host at once
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+        
+        # Earliest start time of the next request to each host. The
+        # delay_between_requests pacing applies per host, so checks against
+        # different stores don't wait on each other
+        self._host_next_request = {}
+        self._host_pacing_lock = threading.Lock()
         
         # Anti-bot user agents
         self.user_agents = [
@@ -596,74 +1075,25 @@ class LinkChecker:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         ]
         
-        # Initialize YouTube API if available
-        self.youtube_service = None
-        if (YOUTUBE_API_AVAILABLE and 
-            self.config.data['settings'].get('youtube_api_key')):
-            try:
-                self.youtube_service = build(
-                    'youtube', 'v3',
-                    developerKey=self.config.data['settings']['youtube_api_key']
-                )
-            except Exception as e:
-                if self.verbose:
-                    print(f"⚠️  YouTube API initialization failed: {e}")
-                    print("Falling back to web scraping for YouTube videos")
-    
-    def get_headers(self) -> dict:
-        """Generate headers with rotating user agent"""
-        return {
-            'User-Agent': random.choice(self.user_agents),
+        # One complete header set per user agent, built once
+        base_headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-GB,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': _ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
-    
-    def is_onelink_url(self, url: str) -> bool:
-        """Check if URL is an Amazon OneLink"""
-        onelink_patterns = [
-            r'amzn\.to/',
-            r'amazon\.com/.*tag=.*-20',  # US affiliate links with tag
-            r'amazon\.co\.uk/.*tag=.*-21',  # UK affiliate links with tag
-            r'amazon\.com/dp/.*\?.*tag=',  # Direct product links with tags
-            r'amazon\.co\.uk/dp/.*\?.*tag=',
+        self._prebuilt_headers = [
+            {'User-Agent': user_agent, **base_headers}
+            for user_agent in self.user_agents
         ]
         
-        for pattern in onelink_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-        return False
-    
-    def extract_amazon_product_id(self, url: str) -> Optional[str]:
-        """Extract Amazon product ID from URL"""
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'/gp/product/([A-Z0-9]{10})',
-            r'amazon\.com/.*?/dp/([A-Z0-9]{10})',
-            r'amazon\.co\.uk/.*?/dp/([A-Z0-9]{10})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
-    
-    def get_regional_headers(self, region: str) -> dict:
-        """Get headers that simulate requests from different regions"""
-        # Use more realistic user agents for Amazon
-        regional_user_agents = {
-            'US': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'UK': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        
-        base_headers = {
-            'User-Agent': regional_user_agents.get(region, random.choice(self.user_agents)),
+        # Region-specific header sets for Amazon checks, also built once.
+        # Use more realistic user agents for Amazon.
+        self._regional_base_headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': _ACCEPT_ENCODING,
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -672,78 +1102,256 @@ class LinkChecker:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0'
         }
-        
-        regional_headers = {
+        self._prebuilt_regional_headers = {
             'US': {
+                **self._regional_base_headers,
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept-Language': 'en-US,en;q=0.9',
                 'CloudFront-Viewer-Country': 'US',
                 'CloudFront-Viewer-Currency': 'USD',
             },
             'UK': {
+                **self._regional_base_headers,
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
                 'Accept-Language': 'en-GB,en;q=0.9',
-                'CloudFront-Viewer-Country': 'GB', 
+                'CloudFront-Viewer-Country': 'GB',
                 'CloudFront-Viewer-Currency': 'GBP',
-            }
+            },
         }
         
-        if region in regional_headers:
-            base_headers.update(regional_headers[region])
+        # Initialize YouTube API if available
+        self.youtube_service = None
+        if (YOUTUBE_API_AVAILABLE and 
+            settings.get('youtube_api_key')):
+            try:
+                from googleapiclient.discovery import build
+                self.youtube_service = build(
+                    'youtube', 'v3',
+                    developerKey=settings['youtube_api_key']
+                )
+            except Exception as e:
+                if self.verbose:
+                    print(f"⚠️  YouTube API initialization failed: {e}")
+                    print("Falling back to web scraping for YouTube videos")
+        
+        # YouTube watch page fields, matched directly on the raw response
+        # body - the description is a JSON string literal in an inline script
+        self._short_desc_re = re.compile(rb'"shortDescription":"((?:[^"\\]|\\.)*)"')
+        self._page_title_re = re.compile(rb'<title[^>]*>([^<]*)</title>', re.IGNORECASE)
+        
+        # AliExpress product page helpers: the site-name suffix on og:title
+        # and <title>, and a price field inside inline JSON
+        self._aliexpress_suffix_re = re.compile(r' (?:-|\||on) AliExpress')
+        self._price_json_re = re.compile(rb'["\']price["\']:\s*["\']?([^"\',$\s]+)')
+        # Product data blob assigned in an inline script. Matching stops at
+        # the opening brace of its 'data' object, which is then decoded as
+        # JSON in place (the surrounding literal isn't always valid JSON).
+        self._runparams_re = re.compile(rb'window\.runParams\s*=\s*\{\s*"?data"?\s*:\s*(?=\{)')
+        self._runparams_price_keys = ('formatedActivityPrice', 'formatedPrice', 'formatedAmount')
+        self._json_decoder = json.JSONDecoder()
+        
+        # Product title/price CSS selectors, joined so each lookup walks the
+        # tree once. Matches come back in document order, not selector order.
+        self._amazon_title_selector = '#productTitle, h1.a-size-large, h1 span'
+        self._amazon_price_selector = '.a-price-whole, .a-offscreen, .a-price .a-offscreen, #price_inside_buybox'
+        self._aliexpress_title_selector = ', '.join([
+            'h1[data-pl="product-title"]',
+            '.product-title-text',
+            'h1.product-title',
+            '.pdp-product-title',
+            '.product-title',
+            'h1',  # fallback to any h1
+            '[data-spm-anchor-id*="title"]',
+            '.title-text',
+        ])
+        self._aliexpress_price_selector = ', '.join([
+            '.product-price-current',
+            '.price-current',
+            '.pdp-price',
+            '[data-spm-anchor-id*="price"]',
+            '.price-value',
+            '.price',
+            'span[class*="price"]',
+        ])
+        
+        # Lowercase page-text indicators, matched against the text extracted
+        # once per response
+        self._amazon_bot_indicators = (
+            'robot check',
+            'unusual traffic',
+            'automated requests',
+            'verify you are human',
+            'captcha',
+            'something went wrong',
+            'sorry, we just need to make sure you',
+            'enter the characters you see below',
+        )
+        self._amazon_unavailable_indicators = (
+            'currently unavailable',
+            'out of stock',
+            'temporarily out of stock',
+        )
+        self._aliexpress_error_indicators = (
+            'product not found',
+            'item not available',
+            'seller not found',
+        )
+    
+    def extract_runparams_price(self, page: bytes) -> Optional[str]:
+        """Get the formatted price from an AliExpress window.runParams blob"""
+        if b'runParams' not in page:
+            return None
         
-        return base_headers
-
-    def extract_video_id(self, url: str) -> Optional[str]:
-        """Extract YouTube video ID from URL"""
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]{11})',
-            r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        ]
+        match = self._runparams_re.search(page)
+        if not match:
+            return None
+        
+        try:
+            data, _ = self._json_decoder.raw_decode(page[match.end():].decode('utf-8', 'replace'))
+        except ValueError:
+            return None
         
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        # Breadth-first so the top-level price module wins over prices of
+        # bundled or recommended items nested further down
+        nodes = deque([data])
+        while nodes:
+            node = nodes.popleft()
+            if isinstance(node, dict):
+                for key in self._runparams_price_keys:
+                    value = node.get(key)
+                    if isinstance(value, str) and value.strip():
+                        return value.strip()
+                nodes.extend(node.values())
+            elif isinstance(node, list):
+                nodes.extend(node)
+        return None
+    
+    def host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore capping concurrent requests to url's host"""
+        host = _url_host(url)
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.max_requests_per_host)
+        return slot
+    
+    def pace_host(self, url: str):
+        """Wait until a request to url's host is due under delay_between_requests"""
+        host = _url_host(url)
+        with self._host_pacing_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_request.get(host, now))
+            self._host_next_request[host] = start + self.delay_between_requests
+        if start > now:
+            time.sleep(start - now)
+    
+    def read_page(self, response) -> bytes:
+        """Read a streamed product page, stopping at max_page_bytes
+        
+        Title, price and availability sit well before the end of the page,
+        so the rest (often MBs of inline scripts) isn't downloaded. lxml
+        copes with the truncated markup. The response is closed afterwards.
+        """
+        limit = self.max_page_bytes
+        body = bytearray()
+        try:
+            for chunk in response.iter_content(chunk_size=65536):
+                body += chunk
+                if len(body) >= limit:
+                    break
+        finally:
+            response.close()
+        return bytes(body)
+    
+    def close(self):
+        """Release pooled connections and the caches' database handles"""
+        self.session.close()
+        self.cached_session.close()
+        if self.cache is not None:
+            self.cache.close()
+    
+    def get_headers(self) -> dict:
+        """Pick headers with a rotating user agent (shared dict - don't mutate)"""
+        return random.choice(self._prebuilt_headers)
+    
+    def is_onelink_url(self, url: str) -> bool:
+        """Check if URL is an Amazon OneLink"""
+        return _ONELINK_RE.search(url) is not None
+    
+    def extract_amazon_product_id(self, url: str) -> Optional[str]:
+        """Extract Amazon product ID from URL"""
+        for pattern in _AMAZON_PRODUCT_ID_RES:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         return None
     
+    def get_regional_headers(self, region: str) -> dict:
+        """Get headers that simulate requests from different regions (shared dict - don't mutate)"""
+        headers = self._prebuilt_regional_headers.get(region)
+        if headers is None:
+            # Unknown region - generic browser headers with a rotating user agent
+            headers = {**self._regional_base_headers, 'User-Agent': random.choice(self.user_agents)}
+        return headers
+
+    def extract_video_id(self, url: str) -> Optional[str]:
+        """Extract YouTube video ID from URL"""
+        return _extract_video_id(url)
+    
     def extract_affiliate_links(self, text: str) -> List[Dict[str, str]]:
         """Extract affiliate links from text content"""
         links = []
         
-        # Amazon patterns (UK and US)
-        amazon_patterns = [
-            r'(https?://(?:www\.)?amazon\.co\.uk/[^\s]+)',
-            r'(https?://(?:www\.)?amazon\.com/[^\s]+)', 
-            r'(https?://amzn\.to/[a-zA-Z0-9]+)',
-        ]
-        
-        # AliExpress patterns  
-        aliexpress_patterns = [
-            r'(https?://(?:www\.)?aliexpress\.com/[^\s]+)',
-            r'(https?://s\.click\.aliexpress\.com/e/_[a-zA-Z0-9]+)',
-        ]
-        
-        all_patterns = amazon_patterns + aliexpress_patterns
-        
-        for pattern in all_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                url = match.strip()
-                platform = 'amazon' if 'amazon' in url or 'amzn' in url else 'aliexpress'
-                links.append({
-                    'url': url,
-                    'platform': platform,
-                    'title': self._extract_link_title_from_context(text, url)
-                })
+        lowered = text.lower()
+        host_positions = [lowered.find(host) for host in _AFFILIATE_HOSTS]
+        host_positions = [pos for pos in host_positions if pos != -1]
+        if not host_positions:
+            return links
+        
+        # No match can start earlier than the first host fragment minus the
+        # longest scheme/subdomain prefix ('https://s.click.'), so skip the
+        # text before it
+        scan_start = max(min(host_positions) - 16, 0)
+        
+        # Match on the lowercased copy and slice the original so URLs keep their
+        # case. If lowercasing changed the length (rare non-ASCII case folds)
+        # the offsets wouldn't line up, so fall back to a case-insensitive scan.
+        if len(lowered) == len(text):
+            matches = _AFFILIATE_RE.finditer(lowered, scan_start)
+        else:
+            matches = _AFFILIATE_RE_CI.finditer(text)
+        
+        # The same link often appears more than once in a source (e.g. in the
+        # post text and again as an anchor), so keep only the first
+        seen = set()
+        for match in matches:
+            url = text[match.start():match.end()].strip()
+            if url in seen:
+                continue
+            seen.add(url)
+            links.append({
+                'url': url,
+                'platform': _AFFILIATE_PLATFORMS[match.lastindex - 1],
+                'title': self._extract_link_title_from_context(text, url)
+            })
         
         return links
     
     def _extract_link_title_from_context(self, text: str, url: str) -> str:
         """Try to extract link title from surrounding context"""
-        lines = text.split('\n')
-        for line in lines:
-            if url in line:
-                cleaned = re.sub(r'https?://[^\s]+', '', line).strip()
-                if cleaned and len(cleaned) > 5:
-                    return cleaned[:50]
+        # Jump between the lines mentioning the URL by offset rather than
+        # splitting the whole text once per extracted link
+        pos = text.find(url)
+        while pos != -1:
+            line_start = text.rfind('\n', 0, pos) + 1
+            line_end = text.find('\n', pos)
+            if line_end == -1:
+                line_end = len(text)
+            
+            cleaned = _ANY_URL_RE.sub('', text[line_start:line_end]).strip()
+            if cleaned and len(cleaned) > 5:
+                return cleaned[:50]
+            pos = text.find(url, line_end)
         return "Link"
     
     def get_youtube_content(self, video_url: str, title: str = None) -> Dict:
@@ -756,62 +1364,122 @@ class LinkChecker:
                 'error': 'Invalid YouTube URL'
             }
         
+        content = self.get_youtube_contents_batch([video_url])[video_id]
+        return {**content, 'title': title or content['title']}
+    
+    def get_youtube_contents_batch(self, video_urls: List[str]) -> Dict[str, Dict]:
+        """Get YouTube content for many videos, keyed by video ID
+        
+        API lookups are batched 50 IDs per videos.list call (same quota cost
+        as a single ID). Videos the API can't return fall back to scraping.
+        Invalid URLs are omitted from the result.
+        """
+        contents = {}
+        pending = []
+        
+        for video_url in video_urls:
+            video_id = self.extract_video_id(video_url)
+            if not video_id or video_id in contents:
+                continue
+            
+            # Title and description rarely change, so reuse recent fetches
+            if self.cache is not None:
+                cached = self.cache.get(('youtube_content', video_id))
+                if cached is not None:
+                    contents[video_id] = cached
+                    continue
+            
+            contents[video_id] = None
+            pending.append((video_id, video_url))
+        
         # Try API first if available
         if self.youtube_service:
-            try:
-                response = self.youtube_service.videos().list(
-                    part='snippet',
-                    id=video_id
-                ).execute()
-                
-                if response['items']:
-                    item = response['items'][0]['snippet']
-                    return {
-                        'title': title or item['title'],
-                        'description': item.get('description', ''),
-                        'error': None
-                    }
-            except Exception as e:
-                if self.verbose:
-                    print(f"⚠️  YouTube API failed for {video_id}: {e}")
-        
-        # Fall back to scraping
-        return self._scrape_youtube_video(video_url, title)
+            for i in range(0, len(pending), 50):
+                chunk_ids = [video_id for video_id, _ in pending[i:i + 50]]
+                try:
+                    response = self.youtube_service.videos().list(
+                        part='snippet',
+                        id=','.join(chunk_ids),
+                        maxResults=50,
+                        # Only the fields read below - snippets otherwise carry
+                        # thumbnails, tags and localizations for every video
+                        fields='items(id,snippet(title,description))'
+                    ).execute()
+                    
+                    for item in response['items']:
+                        contents[item['id']] = {
+                            'title': item['snippet']['title'],
+                            'description': item['snippet'].get('description', ''),
+                            'error': None
+                        }
+                except Exception as e:
+                    if self.verbose:
+                        print(f"⚠️  YouTube API failed for {', '.join(chunk_ids)}: {e}")
+        
+        # Fall back to scraping whatever the API didn't return, fetching the
+        # watch pages concurrently
+        to_scrape = [(video_id, video_url) for video_id, video_url in pending
+                     if contents[video_id] is None]
+        if to_scrape:
+            max_workers = self.concurrent_requests
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                scraped = executor.map(self._scrape_youtube_video,
+                                       [video_url for _, video_url in to_scrape])
+                for (video_id, _), content in zip(to_scrape, scraped):
+                    contents[video_id] = content
+        
+        for video_id, _ in pending:
+            # Don't cache empty descriptions - scraping can hit consent/bot pages
+            content = contents[video_id]
+            if self.cache is not None and content['error'] is None and content['description']:
+                self.cache.set(('youtube_content', video_id), content,
+                               expire=self.youtube_cache_ttl)
+        
+        return contents
     
     def _scrape_youtube_video(self, video_url: str, title: str = None) -> Dict:
         """Scrape YouTube video page for description"""
         try:
-            response = self.session.get(
+            with self.host_slot(video_url), self.session.get(
                 video_url, 
                 headers=self.get_headers(),
-                timeout=self.config.data['settings']['request_timeout']
-            )
-            response.raise_for_status()
-            
-            # Extract description from page HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+                timeout=self.request_timeout,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                # The player JSON sits near the top of the page, so stop
+                # reading as soon as the whole description string has arrived
+                body = bytearray()
+                desc_match = None
+                search_from = 0
+                for chunk in response.iter_content(chunk_size=65536):
+                    body += chunk
+                    key_pos = body.find(b'"shortDescription":"', search_from)
+                    if key_pos == -1:
+                        search_from = max(len(body) - 20, 0)
+                        continue
+                    desc_match = self._short_desc_re.match(body, key_pos)
+                    if desc_match:
+                        break
+                    search_from = key_pos
             
             # Try to get title if not provided
             if not title:
-                title_tag = soup.find('title')
-                if title_tag:
-                    title = title_tag.get_text().replace(' - YouTube', '')
+                title_match = self._page_title_re.search(body)
+                if title_match:
+                    title = html.unescape(title_match.group(1).decode('utf-8', 'replace'))
+                    title = title.replace(' - YouTube', '')
             
-            # Look for description in various script tags
+            # Extract description from the embedded player JSON
             description = ""
-            script_tags = soup.find_all('script')
-            for script in script_tags:
-                if script.string and 'shortDescription' in script.string:
-                    # Try to extract description from JSON
-                    try:
-                        content = script.string
-                        desc_match = re.search(r'"shortDescription":"([^"]*)"', content)
-                        if desc_match:
-                            description = desc_match.group(1)
-                            description = description.encode().decode('unicode_escape')
-                            break
-                    except:
-                        continue
+            if desc_match:
+                # The match is the body of a JSON string literal: raw UTF-8
+                # plus \n, \" and \uXXXX escapes (surrogate pairs included)
+                try:
+                    description = json.loads(b'"' + desc_match.group(1) + b'"')
+                except ValueError:
+                    pass
             
             return {
                 'title': title or 'YouTube Video',
@@ -829,57 +1497,49 @@ class LinkChecker:
     def get_blog_content(self, blog_url: str, title: str = None) -> Dict:
         """Get blog post content"""
         try:
-            response = self.session.get(
-                blog_url,
-                headers=self.get_headers(), 
-                timeout=self.config.data['settings']['request_timeout']
-            )
+            with self.host_slot(blog_url):
+                response = self.cached_session.get(
+                    blog_url,
+                    headers=self.get_headers(), 
+                    timeout=self.request_timeout
+                )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            page = HtmlPage(response.content, _declared_charset(response))
             
             # Get title if not provided - try multiple methods
             if not title:
                 # Method 1: <title> tag
-                title_tag = soup.find('title')
-                if title_tag:
-                    title = title_tag.get_text().strip()
+                title_text = page.first_text('title')
+                if title_text is not None:
                     # Clean up HTML entities
-                    import html
-                    title = html.unescape(title)
+                    title = html.unescape(title_text.strip())
                 
                 # Method 2: Try Open Graph title if no title or generic title
                 if not title or 'Blog Post' in title or len(title) < 3:
-                    og_title = soup.find('meta', property='og:title')
-                    if og_title and og_title.get('content'):
-                        title = og_title['content'].strip()
+                    og_title = page.attr('meta[property="og:title"]', 'content')
+                    if og_title:
+                        title = og_title.strip()
                 
                 # Method 3: Try h1 tag
                 if not title or 'Blog Post' in title or len(title) < 3:
-                    h1_tag = soup.find('h1')
-                    if h1_tag:
-                        title = h1_tag.get_text().strip()
+                    h1_text = page.first_text('h1')
+                    if h1_text is not None:
+                        title = h1_text.strip()
             
             # Debug output
             if self.verbose and not title:
                 print(f"    ⚠️  Could not extract title from {blog_url}")
             
-            # Extract all text content
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            text = soup.get_text()
-            
-            # Also get all links with their anchor text
-            links_html = []
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                text_content = link.get_text().strip()
+            # Extract all text content (scripts and styles are left out),
+            # followed by each link with its anchor text, joined once
+            parts = [page.text()]
+            for text_content, href in page.links():
+                text_content = text_content.strip()
                 if text_content:
-                    links_html.append(f"{text_content}: {href}")
+                    parts.append(f"{text_content}: {href}")
             
-            full_content = text + "\n" + "\n".join(links_html)
+            full_content = "\n".join(parts)
             
             return {
                 'title': title or 'Blog Post',
@@ -898,11 +1558,11 @@ class LinkChecker:
     
     def check_amazon_onelink(self, url: str) -> Dict:
         """Check Amazon OneLink across multiple regions"""
-        if not self.config.data['settings']['enable_onelink_checking']:
+        if not self.enable_onelink_checking:
             # Fall back to regular checking if OneLink checking is disabled
             return self.check_amazon_link_single_region(url, 'default')
         
-        regions_to_check = self.config.data['settings']['check_regions']
+        regions_to_check = self.check_regions
         regional_results = {}
         overall_status = 'working'
         errors = []
@@ -922,10 +1582,10 @@ class LinkChecker:
                 if result['status'] == 'broken' and product_id:
                     if self.verbose:
                         print(f"      ⚠️  {region} failed, trying direct link...")
-                    # Add extra delay before retry
-                    time.sleep(self.config.data['settings']['delay_between_requests'])
                     direct_url = self.construct_regional_amazon_url(product_id, region)
                     if direct_url:
+                        # Add extra delay before retry
+                        self.pace_host(direct_url)
                         result = self.check_amazon_link_single_region(direct_url, region)
                         result['direct_link_used'] = True
                         result['direct_url'] = direct_url
@@ -974,17 +1634,17 @@ class LinkChecker:
     def check_amazon_link_with_headers(self, url: str, region: str) -> Dict:
         """Check Amazon link with region-specific headers"""
         try:
-            time.sleep(self.config.data['settings']['delay_between_requests'])
+            self.pace_host(url)
             
             headers = self.get_regional_headers(region)
-            response = self.session.get(
+            with self.host_slot(url), self.session.get(
                 url,
                 headers=headers,
-                timeout=self.config.data['settings']['request_timeout'],
-                allow_redirects=True
-            )
-            
-            return self.parse_amazon_response(response, region)
+                timeout=self.request_timeout,
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                return self.parse_amazon_response(response, region)
             
         except Exception as e:
             return {
@@ -1010,17 +1670,17 @@ class LinkChecker:
     def check_amazon_link_single_region(self, url: str, region: str = 'default') -> Dict:
         """Check Amazon link for a single region (original functionality)"""
         try:
-            time.sleep(self.config.data['settings']['delay_between_requests'])
+            self.pace_host(url)
             
             headers = self.get_regional_headers(region) if region != 'default' else self.get_headers()
-            response = self.session.get(
+            with self.host_slot(url), self.session.get(
                 url,
                 headers=headers,
-                timeout=self.config.data['settings']['request_timeout'],
-                allow_redirects=True
-            )
-            
-            return self.parse_amazon_response(response, region)
+                timeout=self.request_timeout,
+                allow_redirects=True,
+                stream=True
+            ) as response:
+                return self.parse_amazon_response(response, region)
             
         except requests.exceptions.RequestException as e:
             return {
@@ -1043,9 +1703,12 @@ class LinkChecker:
         if self.verbose and response.status_code != 200:
             print(f"        ⚠️  {region} Response: HTTP {response.status_code}, URL: {response.url[:80]}...")
         
+        # Path of the final URL after redirects, parsed once for the checks below
+        final_path = urlsplit(response.url).path
+        
         # Handle Amazon's 500 errors - if we got redirected to a product page, 
         # it's likely the link works even if Amazon returns 500
-        if response.status_code == 500 and '/dp/' in response.url:
+        if response.status_code == 500 and '/dp/' in final_path:
             return {
                 'status': 'working',
                 'title': f'Amazon Product ({region} - 500 Error but Valid)',
@@ -1055,7 +1718,7 @@ class LinkChecker:
         
         # Amazon sometimes returns 503 (Service Unavailable) for bot detection
         # If we got redirected to a valid product page, treat as working
-        if response.status_code == 503 and '/dp/' in response.url:
+        if response.status_code == 503 and '/dp/' in final_path:
             return {
                 'status': 'working',
                 'title': f'Amazon Product ({region} - Bot Detection but Valid)',
@@ -1072,10 +1735,8 @@ class LinkChecker:
                 'error': f'HTTP {response.status_code} error'
             }
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
         # Check if redirected to search page (product removed)
-        if '/s?' in response.url or 'search' in response.url.lower():
+        if final_path == '/s' or final_path.startswith('/s/') or 'search' in final_path.lower():
             return {
                 'status': 'broken',
                 'title': f'Product Not Found ({region})',
@@ -1083,24 +1744,19 @@ class LinkChecker:
                 'error': f'Product no longer available in {region} (redirects to search page)'
             }
         
+        # Only download and parse the body once it's a product page worth
+        # extracting from
+        page = HtmlPage(self.read_page(response), _declared_charset(response))
+        
+        # Page text is extracted and lowercased once, then shared by the bot
+        # detection and availability checks below
+        page_text = page.text().lower()
+        
         # If we got to a valid product page (/dp/ in URL), but got blocked content,
         # treat as working link with limited access
-        if '/dp/' in response.url:
-            page_text = soup.get_text().lower()
-            
+        if '/dp/' in final_path:
             # Check for bot detection indicators
-            bot_indicators = [
-                'robot check',
-                'unusual traffic',
-                'automated requests',
-                'verify you are human',
-                'captcha',
-                'something went wrong',
-                'sorry, we just need to make sure you',
-                'enter the characters you see below'
-            ]
-            
-            for indicator in bot_indicators:
+            for indicator in self._amazon_bot_indicators:
                 if indicator in page_text:
                     return {
                         'status': 'working',
@@ -1120,46 +1776,28 @@ class LinkChecker:
                 }
         
         # Extract product title
-        title_selectors = ['#productTitle', 'h1.a-size-large', 'h1 span']
         title = f'Amazon Product ({region})'
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                title = title_elem.get_text().strip()
-                break
+        title_text = page.first_text(self._amazon_title_selector)
+        if title_text is not None:
+            title = title_text.strip()
         
         # Extract price with regional currency detection
         price = None
-        price_selectors = [
-            '.a-price-whole',
-            '.a-offscreen',
-            '.a-price .a-offscreen',
-            '#price_inside_buybox'
-        ]
-        for selector in price_selectors:
-            price_elem = soup.select_one(selector)
-            if price_elem:
-                price_text = price_elem.get_text().strip()
-                # Look for various currency symbols
-                if any(symbol in price_text for symbol in ['£', '$', '€', '¥']):
-                    price = price_text
-                    break
+        for price_text in page.texts(self._amazon_price_selector):
+            price_text = price_text.strip()
+            # Look for various currency symbols
+            if any(symbol in price_text for symbol in ['£', '$', '€', '¥']):
+                price = price_text
+                break
         
         # Check availability
-        availability_indicators = [
-            'Currently unavailable',
-            'Out of stock',
-            'Temporarily out of stock'
-        ]
-        
-        page_text = soup.get_text().lower()
-        for indicator in availability_indicators:
-            if indicator.lower() in page_text:
+        for indicator in self._amazon_unavailable_indicators:
+            if indicator in page_text:
                 return {
                     'status': 'broken',
                     'title': title,
                     'price': price,
-                    'error': f'Product {indicator.lower()} in {region}'
+                    'error': f'Product {indicator} in {region}'
                 }
         
         # If we got here, assume it's working
@@ -1185,148 +1823,124 @@ class LinkChecker:
         """Check AliExpress link status"""
         try:
             # Add delay for rate limiting
-            time.sleep(self.config.data['settings']['delay_between_requests'])
-            
-            response = self.session.get(
-                url,
-                headers=self.get_headers(),
-                timeout=self.config.data['settings']['request_timeout'],
-                allow_redirects=True
-            )
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Debug info for verbose mode
-            if self.verbose:
-                final_url = response.url
-                if final_url != url:
-                    print(f"      → Redirected to: {final_url[:60]}...")
+            self.pace_host(url)
+            
+            with self.host_slot(url):
+                response = self.session.get(
+                    url,
+                    headers=self.get_headers(),
+                    timeout=self.request_timeout,
+                    allow_redirects=True,
+                    stream=True
+                )
+                
+                # Debug info for verbose mode
+                if self.verbose:
+                    final_url = response.url
+                    if final_url != url:
+                        print(f"      → Redirected to: {final_url[:60]}...")
+                
+                # Check for error pages - decided from the status alone, so the
+                # body is never read or parsed
+                if response.status_code == 404:
+                    response.close()
+                    return {
+                        'status': 'broken',
+                        'title': 'AliExpress Product',
+                        'price': None,
+                        'error': '404 Not Found'
+                    }
+                
+                body = self.read_page(response)
             
-            # Check for error pages
-            if response.status_code == 404:
-                return {
-                    'status': 'broken',
-                    'title': 'AliExpress Product',
-                    'price': None,
-                    'error': '404 Not Found'
-                }
+            page = HtmlPage(body, _declared_charset(response))
             
             # Extract product title - try multiple approaches
             title = 'AliExpress Product'
             
+            # All meta tags are collected in one pass and shared by the title
+            # and price lookups below
+            meta = page.meta()
+            
             # First try OpenGraph meta tags (most reliable for AliExpress)
-            og_title = soup.find('meta', property='og:title')
-            if og_title and og_title.get('content'):
-                og_content = og_title['content'].strip()
+            og_content = meta.get(('property', 'og:title'))
+            if og_content:
+                og_content = og_content.strip()
                 # Remove AliExpress suffixes
-                for suffix in [' - AliExpress', ' | AliExpress', ' on AliExpress', ' - AliExpress 13']:
-                    if suffix in og_content:
-                        title = og_content.split(suffix)[0].strip()
-                        break
-                else:
-                    if len(og_content) > 10:
-                        title = og_content[:80].strip()
+                suffix = self._aliexpress_suffix_re.search(og_content)
+                if suffix:
+                    title = og_content[:suffix.start()].strip()
+                elif len(og_content) > 10:
+                    title = og_content[:80].strip()
             
             # If no og:title, try CSS selectors
             if title == 'AliExpress Product':
-                title_selectors = [
-                    'h1[data-pl="product-title"]',
-                    '.product-title-text',
-                    'h1.product-title',
-                    '.pdp-product-title',
-                    '.product-title',
-                    'h1',  # fallback to any h1
-                    '[data-spm-anchor-id*="title"]',
-                    '.title-text'
-                ]
-                
-                for selector in title_selectors:
-                    title_elem = soup.select_one(selector)
-                    if title_elem:
-                        candidate = title_elem.get_text().strip()
-                        if candidate and len(candidate) > 5 and 'aliexpress' not in candidate.lower():
-                            title = candidate
-                            break
+                for candidate in page.texts(self._aliexpress_title_selector):
+                    candidate = candidate.strip()
+                    if candidate and len(candidate) > 5 and 'aliexpress' not in candidate.lower():
+                        title = candidate
+                        break
             
             # If still no title found, try extracting from page title
             if title == 'AliExpress Product':
-                page_title = soup.find('title')
-                if page_title:
-                    page_title_text = page_title.get_text()
+                page_title_text = page.first_text('title')
+                if page_title_text is not None:
                     # Remove common suffixes
-                    for suffix in [' - AliExpress', ' | AliExpress', ' on AliExpress']:
-                        if suffix in page_title_text:
-                            title = page_title_text.split(suffix)[0].strip()
-                            break
-                    else:
-                        if len(page_title_text) > 10:
-                            title = page_title_text[:60].strip()
+                    suffix = self._aliexpress_suffix_re.search(page_title_text)
+                    if suffix:
+                        title = page_title_text[:suffix.start()].strip()
+                    elif len(page_title_text) > 10:
+                        title = page_title_text[:60].strip()
             
             # Extract price - try multiple approaches
             price = None
             
             # First try OpenGraph/meta tags for price
-            price_meta_tags = [
-                ('meta', 'property', 'product:price:amount'),
-                ('meta', 'property', 'og:price:amount'),
-                ('meta', 'name', 'price'),
-                ('meta', 'itemprop', 'price')
+            price_meta_keys = [
+                ('property', 'product:price:amount'),
+                ('property', 'og:price:amount'),
+                ('name', 'price'),
+                ('itemprop', 'price')
             ]
             
-            for tag, attr, value in price_meta_tags:
-                price_meta = soup.find(tag, {attr: value})
-                if price_meta and price_meta.get('content'):
-                    price_content = price_meta['content'].strip()
+            for meta_key in price_meta_keys:
+                price_content = meta.get(meta_key)
+                if price_content:
+                    price_content = price_content.strip()
                     if price_content and price_content != '0':
                         # Get currency if available
-                        currency_meta = soup.find('meta', property='product:price:currency')
-                        currency = currency_meta['content'] if currency_meta else ''
+                        currency = meta.get(('property', 'product:price:currency')) or ''
                         price = f"{currency} {price_content}".strip()
                         break
             
-            # If no meta price, try CSS selectors
+            # Then the product data blob most item pages embed
             if not price:
-                price_selectors = [
-                    '.product-price-current',
-                    '.price-current', 
-                    '.pdp-price',
-                    '[data-spm-anchor-id*="price"]',
-                    '.price-value',
-                    '.price',
-                    'span[class*="price"]'
-                ]
-                
-                for selector in price_selectors:
-                    price_elem = soup.select_one(selector)
-                    if price_elem:
-                        candidate = price_elem.get_text().strip()
-                        # Look for currency symbols
-                        if any(symbol in candidate for symbol in ['$', '€', '£', '¥', 'US', 'EUR']):
-                            price = candidate
-                            break
+                price = self.extract_runparams_price(body)
             
-            # Also try to find price in script tags (JSON data)
+            # If still no price, try CSS selectors
             if not price:
-                script_tags = soup.find_all('script')
-                for script in script_tags:
-                    if script.string and any(keyword in script.string for keyword in ['price', 'amount']):
-                        # Look for price patterns in JSON
-                        price_matches = re.findall(r'["\']price["\']:\s*["\']?([^"\',$\s]+)', script.string)
-                        if price_matches:
-                            candidate = price_matches[0]
-                            if candidate and candidate != '0':
-                                price = candidate
-                                break
+                for candidate in page.texts(self._aliexpress_price_selector):
+                    candidate = candidate.strip()
+                    # Look for currency symbols
+                    if any(symbol in candidate for symbol in ['$', '€', '£', '¥', 'US', 'EUR']):
+                        price = candidate
+                        break
             
-            # Check if product exists by looking for common error indicators
-            page_text = soup.get_text().lower()
-            error_indicators = [
-                'product not found',
-                'item not available',
-                'seller not found'
-            ]
+            # Also try to find price in the embedded JSON data - one pass
+            # over the raw body starting at the first 'price', rather than a
+            # search per script element
+            if not price:
+                start = body.find(b'price')
+                if start != -1:
+                    for price_match in self._price_json_re.finditer(body, max(start - 1, 0)):
+                        candidate = price_match.group(1)
+                        if candidate != b'0':
+                            price = candidate.decode('utf-8', 'replace')
+                            break
             
-            for indicator in error_indicators:
+            # Check if product exists by looking for common error indicators
+            page_text = page.text().lower()
+            for indicator in self._aliexpress_error_indicators:
                 if indicator in page_text:
                     return {
                         'status': 'broken',
@@ -1363,26 +1977,50 @@ class LinkChecker:
         url = link_info['url']
         platform = link_info['platform']
         
-        if platform == 'amazon':
-            result = self.check_amazon_link(url)
-        elif platform == 'aliexpress':
-            result = self.check_aliexpress_link(url)
-        else:
-            result = {
-                'status': 'broken',
-                'title': link_info['title'],
-                'price': None,
-                'error': f'Unsupported platform: {platform}'
-            }
+        key = (platform, _normalize_link_url(url))
+        with self._link_locks_lock:
+            key_lock = self._link_locks.setdefault(key, threading.Lock())
         
-        # Add original link info
+        with key_lock:
+            result = self._link_results.get(key)
+            if result is None and self.cache is not None:
+                result = self.cache.get(('link_result',) + key)
+            
+            if result is None:
+                if platform == 'amazon':
+                    result = self.check_amazon_link(url)
+                elif platform == 'aliexpress':
+                    result = self.check_aliexpress_link(url)
+                else:
+                    result = {
+                        'status': 'broken',
+                        'title': link_info['title'],
+                        'price': None,
+                        'error': f'Unsupported platform: {platform}'
+                    }
+                
+                # Only persist working links - failures are often transient
+                # (timeouts, bot walls) and should be retried next run
+                if self.cache is not None and result['status'] == 'working':
+                    self.cache.set(('link_result',) + key, result,
+                                   expire=self.link_cache_ttl)
+            
+            self._link_results[key] = result
+        
+        return self.result_for_link(result, link_info)
+    
+    def result_for_link(self, result: Dict, link_info: Dict) -> Dict:
+        """Copy of a (shared, cached) check result carrying link_info's details"""
+        result = dict(result)
         result.update({
-            'url': url,
-            'platform': platform,
+            'url': link_info['url'],
+            'platform': link_info['platform'],
             'original_title': link_info['title'],
-            'source': link_info['source']
+            'source': link_info['source'],
+            # Title shown in reports - the page title, unless the check
+            # couldn't get one and left the 'Link' placeholder
+            'display_title': result['title'] if result['title'] != 'Link' else link_info['title']
         })
-        
         return result
     
     def process_sources(self, discover_mode: bool = False) -> Tuple[List[Dict], List[Dict]]:
@@ -1395,8 +2033,11 @@ class LinkChecker:
             if self.verbose:
                 print("🔍 DISCOVERING URLS FROM CHANNELS AND DOMAINS...")
             
-            discovery = URLDiscovery(self.config, self.verbose)
-            discovered_videos, discovered_posts = discovery.discover_all_sources()
+            discovery = URLDiscovery(self.config, self.verbose, self.cache)
+            try:
+                discovered_videos, discovered_posts = discovery.discover_all_sources()
+            finally:
+                discovery.close()
             
             # Add discovered videos to sources
             if discovered_videos:
@@ -1422,12 +2063,20 @@ class LinkChecker:
             all_videos = self.config.data['sources'].get('youtube_videos', []) or []
             all_posts = self.config.data['sources'].get('blog_posts', []) or []
         
-        # Process YouTube videos
+        # Process YouTube videos - fetch all metadata up front so API lookups
+        # can be batched
+        youtube_contents = self.get_youtube_contents_batch([video['url'] for video in all_videos])
         for video in all_videos:
+            video_id = self.extract_video_id(video['url'])
+            if video_id in youtube_contents:
+                content = youtube_contents[video_id]
+                content = {**content, 'title': video.get('title') or content['title']}
+            else:
+                content = self.get_youtube_content(video['url'], video.get('title'))
+            
             if self.verbose:
-                print(f"📺 Processing: {video.get('title', video['url'])}")
+                print(f"📺 Processing: {content['title']}")
             
-            content = self.get_youtube_content(video['url'], video.get('title'))
             links = self.extract_affiliate_links(content['description'])
             
             source_info = {
@@ -1444,80 +2093,140 @@ class LinkChecker:
                 link['source'] = source_info
                 all_links.append(link)
         
-        # Process blog posts
-        for blog in all_posts:
-            # First get the content to extract the title
-            content = self.get_blog_content(blog['url'], blog.get('title'))
-            
-            # Now we can show the proper title
-            if self.verbose:
-                display_title = content['title'] if content['title'] != 'Blog Post' else blog.get('title', blog['url'])
-                print(f"📝 Processing: {display_title}")
-            
-            links = self.extract_affiliate_links(content['content'])
-            
-            source_info = {
-                'type': 'blog',
-                'url': blog['url'],
-                'title': content['title'], 
-                'links': links,
-                'error': content['error']
-            }
-            all_sources.append(source_info)
+        # Process blog posts - pages are fetched concurrently, map() hands
+        # them back in config order
+        max_workers = self.concurrent_requests
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            blog_contents = executor.map(
+                lambda blog: self.get_blog_content(blog['url'], blog.get('title')),
+                all_posts
+            )
             
-            # Add source context to each link
-            for link in links:
-                link['source'] = source_info
-                all_links.append(link)
+            for blog, content in zip(all_posts, blog_contents):
+                # Now we can show the proper title
+                if self.verbose:
+                    display_title = content['title'] if content['title'] != 'Blog Post' else blog.get('title', blog['url'])
+                    print(f"📝 Processing: {display_title}")
+                
+                links = self.extract_affiliate_links(content['content'])
+                
+                source_info = {
+                    'type': 'blog',
+                    'url': blog['url'],
+                    'title': content['title'], 
+                    'links': links,
+                    'error': content['error']
+                }
+                all_sources.append(source_info)
+                
+                # Add source context to each link
+                for link in links:
+                    link['source'] = source_info
+                    all_links.append(link)
         
         return all_sources, all_links
     
+    def _print_results(self, result_queue: queue.Queue):
+        """Print verbose check results as they arrive, until a None sentinel"""
+        while True:
+            result = result_queue.get()
+            if result is None:
+                break
+            
+            status_icon = "✅" if result['status'] == 'working' else "⚠️" if result['status'] == 'partial' else "❌"
+            source_type = "📺" if result['source']['type'] == 'youtube' else "📝"
+            source_title = result['source']['title'][:30]
+            link_url = result['url'][:60]
+            product_title = result['title'][:40]
+            print(f"  {status_icon} {source_type} {source_title} | {product_title}")
+            print(f"      └─ {link_url}")
+            
+            # Show regional information for OneLink URLs
+            if result.get('is_onelink') and result.get('regional_results'):
+                for region, regional_result in result['regional_results'].items():
+                    region_icon = "✅" if regional_result['status'] == 'working' else "❌"
+                    print(f"        🌍 {region}: {region_icon} {regional_result.get('error', 'OK')}")
+                    if regional_result.get('direct_link_used'):
+                        print(f"          └─ Used direct link: {regional_result.get('direct_url', '')[:50]}...")
+            
+            # Piped stdout is block-buffered; flush so progress shows up as
+            # each check finishes (e.g. under tee or in a CI log)
+            sys.stdout.flush()
+    
     def check_all_links(self, links: List[Dict]) -> List[Dict]:
         """Check all links with concurrent processing"""
         if not links:
             return []
         
-        results = []
-        max_workers = self.config.data['settings']['concurrent_requests']
+        # Results are slotted back into link order, so the report doesn't
+        # depend on which checks happened to finish first
+        results = [None] * len(links)
+        max_workers = self.concurrent_requests
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all link checking tasks
-            future_to_link = {
-                executor.submit(self.check_link, link): link 
-                for link in links
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_link):
-                result = future.result()
-                results.append(result)
+        # Verbose output is handed to a printer thread so terminal writes
+        # don't hold up collecting results
+        result_queue = None
+        if self.verbose:
+            result_queue = queue.Queue()
+            printer = threading.Thread(target=self._print_results, args=(result_queue,), daemon=True)
+            printer.start()
+        
+        # The same product often appears in several sources. Submit one check
+        # per distinct link and fan its result out to every occurrence, rather
+        # than tying up workers waiting on check_link's per-link locks.
+        link_groups = defaultdict(list)
+        for index, link in enumerate(links):
+            link_groups[(link['platform'], _normalize_link_url(link['url']))].append(index)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all link checking tasks
+                future_to_group = {
+                    executor.submit(self.check_link, links[group[0]]): group
+                    for group in link_groups.values()
+                }
                 
-                if self.verbose:
-                    status_icon = "✅" if result['status'] == 'working' else "⚠️" if result['status'] == 'partial' else "❌"
-                    source_type = "📺" if result['source']['type'] == 'youtube' else "📝"
-                    source_title = result['source']['title'][:30]
-                    link_url = result['url'][:60]
-                    product_title = result['title'][:40]
-                    print(f"  {status_icon} {source_type} {source_title} | {product_title}")
-                    print(f"      └─ {link_url}")
-                    
-                    # Show regional information for OneLink URLs
-                    if result.get('is_onelink') and result.get('regional_results'):
-                        for region, regional_result in result['regional_results'].items():
-                            region_icon = "✅" if regional_result['status'] == 'working' else "❌"
-                            print(f"        🌍 {region}: {region_icon} {regional_result.get('error', 'OK')}")
-                            if regional_result.get('direct_link_used'):
-                                print(f"          └─ Used direct link: {regional_result.get('direct_url', '')[:50]}...")
+                # Collect results as they complete
+                for future in as_completed(future_to_group):
+                    first_result = future.result()
+                    group = future_to_group[future]
+                    for index in group:
+                        if index == group[0]:
+                            result = first_result
+                        else:
+                            result = self.result_for_link(first_result, links[index])
+                        results[index] = result
+                        
+                        if result_queue is not None:
+                            result_queue.put(result)
+        finally:
+            if result_queue is not None:
+                result_queue.put(None)
+                printer.join()
         
         return results
 
-
 class OutputFormatter:
     """Handle different output formats"""
     
-    def __init__(self, verbose: bool = False, format_type: str = 'text'):
+    # Markers used by the text report. Output that isn't going to a terminal
+    # (log files, cron mail, pipes) gets plain ASCII instead of emoji.
+    UNICODE_GLYPHS = {
+        'alert': '🚨', 'warn': '⚠️ ', 'ok': '✅', 'bad': '❌', 'summary': '📊',
+        'youtube': '📺', 'blog': '📝', 'branch': '├─', 'last': '└─',
+    }
+    ASCII_GLYPHS = {
+        'alert': '!!', 'warn': '[!]', 'ok': '[OK]', 'bad': '[BROKEN]', 'summary': '==',
+        'youtube': '[video]', 'blog': '[post]', 'branch': '+-', 'last': '`-',
+    }
+    
+    def __init__(self, verbose: bool = False, format_type: str = 'text',
+                 ascii_only: Optional[bool] = None):
         self.verbose = verbose
         self.format_type = format_type
+        if ascii_only is None:
+            ascii_only = not sys.stdout.isatty()
+        self.glyphs = self.ASCII_GLYPHS if ascii_only else self.UNICODE_GLYPHS
     
     def format_results(self, sources: List[Dict], results: List[Dict]) -> str:
         """Format results based on specified format"""
@@ -1531,19 +2240,20 @@ class OutputFormatter:
         working_count = sum(1 for r in results if r['status'] == 'working')
         broken_count = len(results) - working_count
         
-        issues = []
-        for result in results:
-            if result['status'] == 'broken':
-                issues.append({
-                    'source_type': result['source']['type'],
-                    'source_title': result['source']['title'],
-                    'source_url': result['source']['url'],
-                    'link_url': result['url'],
-                    'link_title': result['title'],
-                    'status': result['status'],
-                    'error': result['error'],
-                    'platform': result['platform']
-                })
+        issues = [
+            {
+                'source_type': result['source']['type'],
+                'source_title': result['source']['title'],
+                'source_url': result['source']['url'],
+                'link_url': result['url'],
+                'link_title': result['title'],
+                'status': result['status'],
+                'error': result['error'],
+                'platform': result['platform']
+            }
+            for result in results
+            if result['status'] == 'broken'
+        ]
         
         output = {
             'summary': {
@@ -1555,6 +2265,8 @@ class OutputFormatter:
             'issues': issues
         }
         
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
         return json.dumps(output, indent=2)
     
     def _format_text(self, sources: List[Dict], results: List[Dict]) -> str:
@@ -1562,106 +2274,93 @@ class OutputFormatter:
         if not results:
             return "No affiliate links found in the provided sources."
         
-        working_results = [r for r in results if r['status'] == 'working']
-        partial_results = [r for r in results if r['status'] == 'partial']  # OneLink partial results
-        broken_results = [r for r in results if r['status'] == 'broken']
+        # Group by status, then by source, in a single pass. 'partial' is a
+        # OneLink that works in only some regions.
+        grouped = {status: defaultdict(list) for status in ('working', 'partial', 'broken')}
+        counts = dict.fromkeys(grouped, 0)
+        for result in results:
+            by_source = grouped.get(result['status'])
+            if by_source is not None:
+                by_source[(result['source']['type'], result['source']['title'])].append(result)
+                counts[result['status']] += 1
+        
+        working_count = counts['working']
+        partial_count = counts['partial']
+        broken_count = counts['broken']
         
+        g = self.glyphs
         output_lines = []
         
         # Header with summary
-        issues_count = len(broken_results) + len(partial_results)
+        issues_count = broken_count + partial_count
         if issues_count > 0:
-            output_lines.append(f"🚨 LINK ISSUES FOUND ({issues_count} issues)")
-            if partial_results:
-                output_lines.append(f"    ⚠️  {len(partial_results)} OneLink URLs work partially (some regions)")
-            if broken_results:
-                output_lines.append(f"    ❌ {len(broken_results)} URLs completely broken")
+            output_lines.append(f"{g['alert']} LINK ISSUES FOUND ({issues_count} issues)")
+            if partial_count:
+                output_lines.append(f"    {g['warn']} {partial_count} OneLink URLs work partially (some regions)")
+            if broken_count:
+                output_lines.append(f"    {g['bad']} {broken_count} URLs completely broken")
             output_lines.append("")
         
         # Show partial OneLink results first
-        if partial_results:
-            output_lines.append("⚠️  PARTIAL ONELINK URLS (work in some regions):")
-            
-            # Group by source
-            sources_with_partial = {}
-            for result in partial_results:
-                source_key = (result['source']['type'], result['source']['title'])
-                if source_key not in sources_with_partial:
-                    sources_with_partial[source_key] = []
-                sources_with_partial[source_key].append(result)
-            
-            for (source_type, source_title), source_results in sources_with_partial.items():
-                icon = "📺" if source_type == 'youtube' else "📝"
+        if partial_count:
+            output_lines.append(f"{g['warn']} PARTIAL ONELINK URLS (work in some regions):")
+            
+            for (source_type, source_title), source_results in grouped['partial'].items():
+                icon = g['youtube'] if source_type == 'youtube' else g['blog']
                 output_lines.append(f"{icon} \"{source_title}\"")
                 
                 for result in source_results:
-                    title = result['title'] if result['title'] != 'Link' else result['original_title']
-                    output_lines.append(f"  ├─ {title} - {result['url']}")
+                    title = result['display_title']
+                    output_lines.append(f"  {g['branch']} {title} - {result['url']}")
                     
                     # Show regional breakdown
                     if result.get('regional_results'):
                         for region, regional_result in result['regional_results'].items():
-                            status = "✅ Working" if regional_result['status'] == 'working' else f"❌ {regional_result.get('error', 'Failed')}"
-                            output_lines.append(f"     └─ {region}: {status}")
+                            status = f"{g['ok']} Working" if regional_result['status'] == 'working' else f"{g['bad']} {regional_result.get('error', 'Failed')}"
+                            output_lines.append(f"     {g['last']} {region}: {status}")
                     else:
-                        output_lines.append(f"     └─ ERROR: {result['error']}")
+                        output_lines.append(f"     {g['last']} ERROR: {result['error']}")
                 output_lines.append("")
         
         # Show completely broken links
-        if broken_results:
-            output_lines.append("❌ BROKEN LINKS:")
-            
-            # Group by source
-            sources_with_broken = {}
-            for result in broken_results:
-                source_key = (result['source']['type'], result['source']['title'])
-                if source_key not in sources_with_broken:
-                    sources_with_broken[source_key] = []
-                sources_with_broken[source_key].append(result)
-            
-            for (source_type, source_title), source_results in sources_with_broken.items():
-                icon = "📺" if source_type == 'youtube' else "📝"
+        if broken_count:
+            output_lines.append(f"{g['bad']} BROKEN LINKS:")
+            
+            for (source_type, source_title), source_results in grouped['broken'].items():
+                icon = g['youtube'] if source_type == 'youtube' else g['blog']
                 output_lines.append(f"{icon} \"{source_title}\"")
                 
                 for result in source_results:
-                    title = result['title'] if result['title'] != 'Link' else result['original_title']
-                    output_lines.append(f"  ├─ {title} - {result['url']}")
-                    output_lines.append(f"     └─ ERROR: {result['error']}")
+                    title = result['display_title']
+                    output_lines.append(f"  {g['branch']} {title} - {result['url']}")
+                    output_lines.append(f"     {g['last']} ERROR: {result['error']}")
                 output_lines.append("")
         
         # Show working links only in verbose mode
-        if self.verbose and working_results:
-            output_lines.append("✅ WORKING LINKS:")
-            
-            # Group by source
-            sources_with_working = {}
-            for result in working_results:
-                source_key = (result['source']['type'], result['source']['title'])
-                if source_key not in sources_with_working:
-                    sources_with_working[source_key] = []
-                sources_with_working[source_key].append(result)
-            
-            for (source_type, source_title), source_results in sources_with_working.items():
-                icon = "📺" if source_type == 'youtube' else "📝"
+        if self.verbose and working_count:
+            output_lines.append(f"{g['ok']} WORKING LINKS:")
+            
+            for (source_type, source_title), source_results in grouped['working'].items():
+                icon = g['youtube'] if source_type == 'youtube' else g['blog']
                 output_lines.append(f"{icon} \"{source_title}\"")
                 
                 for result in source_results:
-                    title = result['title'] if result['title'] != 'Link' else result['original_title']
+                    title = result['display_title']
                     price = f" - {result['price']}" if result['price'] else ""
-                    output_lines.append(f"  └─ ✅ {title}{price}")
+                    output_lines.append(f"  {g['last']} {g['ok']} {title}{price}")
                 output_lines.append("")
         
         # Summary
-        total_links = len(working_results) + len(partial_results) + len(broken_results)
-        if not broken_results and not partial_results:
-            output_lines.append(f"✅ All links are working properly ({total_links} links checked)")
+        total_links = working_count + partial_count + broken_count
+        if not broken_count and not partial_count:
+            output_lines.append(f"{g['ok']} All links are working properly ({total_links} links checked)")
         else:
-            summary_parts = [f"{len(working_results)} working"]
-            if partial_results:
-                summary_parts.append(f"{len(partial_results)} partial")
-            if broken_results:
-                summary_parts.append(f"{len(broken_results)} broken")
-            output_lines.append(f"📊 SUMMARY: {', '.join(summary_parts)}")
+            summary_parts = [f"{working_count} working"]
+            if partial_count:
+                summary_parts.append(f"{partial_count} partial")
+            if broken_count:
+                summary_parts.append(f"{broken_count} broken")
+            output_lines.append(f"{g['summary']} SUMMARY: {', '.join(summary_parts)}")
         
         return "\n".join(output_lines)
 
@@ -1697,12 +2396,20 @@ def main():
         action='store_true',
         help='Only discover URLs, don\'t check affiliate links'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk cache of discovery results, video metadata, link checks and pages'
+    )
     
     args = parser.parse_args()
     
+    checker = None
     try:
         # Load configuration
         config = Config(args.config)
+        if args.no_cache:
+            config.data['settings']['cache_enabled'] = False
         
         # Initialize checker and formatter
         checker = LinkChecker(config, args.verbose)
@@ -1771,8 +2478,7 @@ def main():
         print(output)
         
         # Exit with error code if there are broken links (for scripting)
-        broken_count = sum(1 for r in results if r['status'] == 'broken')
-        if broken_count > 0:
+        if any(r['status'] == 'broken' for r in results):
             sys.exit(1)
             
     except KeyboardInterrupt:
@@ -1784,6 +2490,9 @@ def main():
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        if checker is not None:
+            checker.close()
 
 
 if __name__ == '__main__':